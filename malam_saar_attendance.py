@@ -14,27 +14,34 @@ Place columns_config.json next to the .exe to override default column x-ranges.
 
 from __future__ import annotations
 
+import functools
 import json
 import logging
+import math
+import multiprocessing
 import os
 import re
 import sys
 import threading
 import tkinter as tk
+from bisect import bisect_right
+from collections import Counter, deque
+from concurrent.futures import BrokenExecutor, ProcessPoolExecutor
 from datetime import date
+from operator import itemgetter
 from tkinter import filedialog, scrolledtext, ttk
 from typing import Any
 
 import openpyxl
-from openpyxl.styles import Alignment, Font, PatternFill
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Font, NamedStyle, PatternFill
 from openpyxl.utils import get_column_letter
-import pdfplumber
 
 # ---------------------------------------------------------------------------
-# Logging – write to an in-memory list that the GUI drains
+# Logging – write to an in-memory queue that the GUI drains
 # ---------------------------------------------------------------------------
 
-_log_messages: list[str] = []
+_log_messages: deque[str] = deque()
 
 
 def _log(msg: str) -> None:
@@ -46,17 +53,20 @@ def _log(msg: str) -> None:
 # RTL / Hebrew normalisation
 # ---------------------------------------------------------------------------
 
-_HEBREW_CHAR_RE = re.compile(r"[\u05D0-\u05EA]")
+# Hebrew letters א..ת; isdisjoint() tests a token against this in one C call
+_HEBREW_CHARS = frozenset(map(chr, range(0x05D0, 0x05EB)))
 
 
+@functools.lru_cache(maxsize=4096)
 def normalize_hebrew_word(word: str) -> str:
     """Reverse *word* if it contains Hebrew characters; leave everything else unchanged.
 
     This reversal is required because pdfplumber extracts Hebrew text in visual
     (left-to-right) PDF order, which reverses the logical character sequence.
     Numbers, times (08:00), dates (12/02), and ASCII symbols are not reversed.
+    Cached: attendance pages repeat the same labels and times on every row.
     """
-    if _HEBREW_CHAR_RE.search(word):
+    if not _HEBREW_CHARS.isdisjoint(word):
         return word[::-1]
     return word
 
@@ -64,10 +74,11 @@ def normalize_hebrew_word(word: str) -> str:
 def normalize_row_words(words: list[dict]) -> list[dict]:
     """Apply normalize_hebrew_word to the 'text' field of each pdfplumber word dict.
 
-    Call immediately after page.extract_words() before any other processing.
+    Call immediately after word extraction, before any other processing.
     """
+    normalize = normalize_hebrew_word
     for w in words:
-        w["text"] = normalize_hebrew_word(w["text"])
+        w["text"] = normalize(w["text"])
     return words
 
 
@@ -103,11 +114,19 @@ DEFAULT_CONFIG: dict[str, list[float]] = {
 }
 
 
+@functools.lru_cache(maxsize=4)
+def _read_config_file(config_path: str, mtime_ns: int) -> dict[str, list[float]]:
+    """Parse *config_path*; *mtime_ns* is part of the cache key so edits are picked up."""
+    with open(config_path, encoding="utf-8") as fh:
+        return json.load(fh)
+
+
 def load_config() -> dict[str, list[float]]:
     """Load columns_config.json from next to the executable (or script).
 
     If the file is absent, the default config is written there and returned.
     Works both in development and when frozen by PyInstaller.
+    The parsed file is cached until its modification time changes.
     """
     # Determine directory that contains the running exe / script
     exe_dir = os.path.dirname(
@@ -135,8 +154,8 @@ def load_config() -> dict[str, list[float]]:
             pass
         return dict(DEFAULT_CONFIG)
 
-    with open(config_path, encoding="utf-8") as fh:
-        return json.load(fh)
+    mtime_ns = os.stat(config_path).st_mtime_ns
+    return dict(_read_config_file(config_path, mtime_ns))
 
 
 # ---------------------------------------------------------------------------
@@ -169,16 +188,41 @@ ACTIVITY_MAP: dict[str, str] = {
 }
 
 # Activity values for which all time/OT columns are set to None
-_NULL_ACTIVITIES = {"אין דיווח נוכחות", "ללא תקן עבודה"}
+_NULL_ACTIVITIES = frozenset({"אין דיווח נוכחות", "ללא תקן עבודה"})
 
 # Regex patterns (applied *after* normalisation → visual/token order preserved,
 # numbers appear BEFORE Hebrew labels in the extracted line)
-_RE_SALARY_MONTH = re.compile(r"(\d{2}/\d{2}/\d{4})\s+שכר\s+בחודש")
-_RE_EMPLOYEE_ID = re.compile(r"(\d{7,9})\s+זהות")
-_RE_TAG_NUMBER = re.compile(r"(\d+)\s+תג:")
-_RE_DATE_TOKEN = re.compile(r"^\d{2}/\d{2}$")
-_RE_TIME_TOKEN = re.compile(r"^\d{2}:\d{2}(:\d{2})?$")
-_RE_DATA_PAGE_MARKER = re.compile(r"חישוב:")
+# Salary month, employee ID and tag number, matched in a single scan; each
+# group is named after the header key it fills.
+_RE_HEADER_FIELDS = re.compile(
+    r"(?P<salary_month>\d{2}/\d{2}/\d{4})\s+שכר\s+בחודש"
+    r"|(?P<employee_id>\d{7,9})\s+זהות"
+    r"|(?P<tag_number>\d+)\s+תג:"
+)
+# Data-page marker 'חישוב:' as it appears in a raw (visual-order) word, i.e.
+# reversed; matching it before normalisation lets summary pages skip that work.
+_DATA_PAGE_MARKER_RAW = "חישוב:"[::-1]
+
+
+# Fixed-shape token tests, used instead of regexes because they run per word.
+# str.isdecimal() accepts exactly the characters the regex \d does.
+
+def _is_date_token(text: str) -> bool:
+    """Return True if *text* is a 'DD/MM' date token."""
+    return (
+        len(text) == 5 and text[2] == "/"
+        and text[:2].isdecimal() and text[3:].isdecimal()
+    )
+
+
+def _is_time_token(text: str) -> bool:
+    """Return True if *text* is an 'HH:MM' or 'HH:MM:SS' time token."""
+    n = len(text)
+    return (
+        (n == 5 or (n == 8 and text[5] == ":" and text[6:].isdecimal()))
+        and text[2] == ":" and text[:2].isdecimal() and text[3:5].isdecimal()
+    )
+
 
 # Fixed Hebrew words that always precede the employee name on the header line.
 # The normalised line is always: '... בשבוע העבודה ימי <NAME_WORDS> שם ...'
@@ -198,15 +242,28 @@ def _extract_employee_name(normalized_text: str) -> str:
     take everything before it, then walk backwards collecting Hebrew words until
     we hit a known stop-word from _NAME_STOP_WORDS or a non-Hebrew token.
     """
-    for line in normalized_text.splitlines():
-        if "שם" in line and "זהות" in line:
+    if "שם" not in normalized_text:
+        return ""
+
+    # Only lines holding 'זהות' can match, so jump between its occurrences
+    # instead of splitting the whole page into lines. Normalised text uses
+    # '\n' as its only line separator.
+    pos = normalized_text.find("זהות")
+    while pos != -1:
+        line_start = normalized_text.rfind("\n", 0, pos) + 1
+        line_end = normalized_text.find("\n", pos)
+        if line_end == -1:
+            line_end = len(normalized_text)
+        line = normalized_text[line_start:line_end]
+        pos = normalized_text.find("זהות", line_end)
+        if "שם" in line:
             before_shem = line.split(" שם")[0]
             tokens = before_shem.strip().split()
             name_parts: list[str] = []
             for token in reversed(tokens):
                 if token in _NAME_STOP_WORDS:
                     break
-                if _HEBREW_CHAR_RE.search(token):
+                if not _HEBREW_CHARS.isdisjoint(token):
                     name_parts.insert(0, token)
                 else:
                     break
@@ -219,15 +276,38 @@ def _extract_employee_name(normalized_text: str) -> str:
 # Column assignment helpers
 # ---------------------------------------------------------------------------
 
-def _assign_column(x0: float, config: dict[str, list[float]]) -> str | None:
-    """Return the column name whose x-range contains *x0*, or None."""
-    for col, (lo, hi) in config.items():
-        if lo <= x0 <= hi:
-            return col
-    return None
+def _compile_columns(
+    config: dict[str, list[float]],
+) -> tuple[list[float], list[str | None]]:
+    """Flatten the column x-ranges into a sorted boundary table for bisect lookup.
+
+    Returns (bounds, names): every x in [bounds[i], bounds[i+1]) belongs to
+    names[i] (None = no column). Ranges may overlap; as with a linear scan of
+    *config*, the first column in config order wins.
+    """
+    bounds = sorted({
+        b for lo, hi in config.values() for b in (lo, math.nextafter(hi, math.inf))
+    })
+    names = [
+        next((col for col, (lo, hi) in config.items() if lo <= b <= hi), None)
+        for b in bounds
+    ]
+    return bounds, names
+
+
+def _assign_column(
+    x0: float, columns: tuple[list[float], list[str | None]]
+) -> str | None:
+    """Return the column name whose x-range contains *x0*, or None.
+
+    *columns* is the table built by _compile_columns.
+    """
+    bounds, names = columns
+    i = bisect_right(bounds, x0) - 1
+    return names[i] if i >= 0 else None
 
 
-def _parse_standard_hours(token: str) -> tuple[str | None, str | None]:
+def _parse_standard_hours(token: str) -> str:
     """Handle the 'standard_hours' merged-token case.
 
     Two adjacent PDF cells are sometimes concatenated by pdfplumber, e.g.
@@ -236,15 +316,12 @@ def _parse_standard_hours(token: str) -> tuple[str | None, str | None]:
     In both cases we take the first 5 characters as the standard_hours value
     and discard the rest (redundant duplicate).
 
-    Returns (standard_hours_value, None).
+    Any other token (a normal time or unparseable text) is returned unchanged.
     """
     # Merged double-time: length 10 ("08:0008:00") or 11 with separator
-    if len(token) >= 10 and _RE_TIME_TOKEN.match(token[:5]):
-        return token[:5], None
-    # Normal time
-    if _RE_TIME_TOKEN.match(token):
-        return token, None
-    return token, None
+    if len(token) >= 10 and _is_time_token(token[:5]):
+        return token[:5]
+    return token
 
 
 def _hhmm_to_excel_time(value: str | None) -> float | None:
@@ -325,18 +402,25 @@ def _calc_night_ot_hours(
 # Date reconstruction
 # ---------------------------------------------------------------------------
 
-def _reconstruct_date(dd: int, mm: int, salary_month_str: str) -> date | None:
-    """Reconstruct a full date from a DD/MM token and the salary_month header.
+def _parse_salary_month(salary_month_str: str) -> tuple[int, int] | None:
+    """Return (year, month) from a salary_month header formatted '01/MM/YYYY'.
 
-    salary_month_str is formatted '01/MM/YYYY'.
+    Returns None if the string is malformed.
     """
     try:
         parts = salary_month_str.split("/")
-        salary_year = int(parts[2])
-        salary_mm = int(parts[1])
+        return int(parts[2]), int(parts[1])
     except (IndexError, ValueError):
         return None
 
+
+def _reconstruct_date(
+    dd: int, mm: int, salary_year: int, salary_mm: int
+) -> date | None:
+    """Reconstruct a full date from a DD/MM token and the parsed salary month.
+
+    *salary_year* and *salary_mm* come from _parse_salary_month.
+    """
     try:
         if mm <= salary_mm:
             return date(salary_year, mm, dd)
@@ -358,17 +442,11 @@ def _extract_headers(page_text: str) -> dict[str, str]:
     """
     headers: dict[str, str] = {}
 
-    m = _RE_SALARY_MONTH.search(page_text)
-    if m:
-        headers["salary_month"] = m.group(1)
-
-    m = _RE_EMPLOYEE_ID.search(page_text)
-    if m:
-        headers["employee_id"] = m.group(1)
-
-    m = _RE_TAG_NUMBER.search(page_text)
-    if m:
-        headers["tag_number"] = m.group(1)
+    # First occurrence of each field wins; stop once all three are found
+    for m in _RE_HEADER_FIELDS.finditer(page_text):
+        headers.setdefault(m.lastgroup, m.group(m.lastgroup))
+        if len(headers) == 3:
+            break
 
     name = _extract_employee_name(page_text)
     if name:
@@ -381,79 +459,108 @@ def _extract_headers(page_text: str) -> dict[str, str]:
 # Page-level row parsing
 # ---------------------------------------------------------------------------
 
-def _group_by_y(words: list[dict], tolerance: float = 4.0) -> dict[int, list[dict]]:
-    """Group words into rows by rounding their y-coordinate to the nearest bucket."""
-    rows: dict[int, list[dict]] = {}
-    for w in words:
-        y = w.get("top", 0.0)
-        bucket = int(round(y / tolerance) * tolerance)
-        rows.setdefault(bucket, []).append(w)
-    return rows
+def _group_by_y(words: list[dict], tolerance: float = 4.0) -> list[list[dict]]:
+    """Group words into rows, returned top to bottom.
+
+    Words are swept once in y order; a new row starts whenever a word sits more
+    than *tolerance* below the first word of the current row. Words within a
+    row keep their extraction order.
+    """
+    order = sorted(range(len(words)), key=lambda i: words[i].get("top", 0.0))
+    rows: list[list[int]] = []
+    row_top: float | None = None
+    for i in order:
+        y = words[i].get("top", 0.0)
+        if row_top is None or y - row_top > tolerance:
+            rows.append([i])
+            row_top = y
+        else:
+            rows[-1].append(i)
+    return [[words[i] for i in sorted(row)] for row in rows]
 
 
 def _parse_data_rows(
     words: list[dict],
     config: dict[str, list[float]],
+    columns: tuple[list[float], list[str | None]],
     salary_month: str,
     page_num: int,
+    verbose: bool = False,
 ) -> list[dict[str, Any]]:
     """Parse daily attendance rows from a list of normalised word dicts.
 
+    *columns* is _compile_columns(config), built once per PDF by the caller.
+    With *verbose*, every row is logged; otherwise only rows whose activity
+    has no ACTIVITY_MAP entry.
     Returns a list of record dicts.
     """
-    date_range = config.get("date", [795, 830])
-    grouped = _group_by_y(words)
-
+    date_lo, date_hi = config.get("date", [795, 830])
+    salary_month_display = (
+        salary_month[3:] if salary_month else ""  # 'MM/YYYY'
+    )
+    # Parsed once per page; every row on the page shares the salary month
+    salary_year_month = _parse_salary_month(salary_month)
+    # Outer edges of the column table: words outside [x_min, x_end) (page
+    # headers, footers, margins) can never be assigned a column
+    bounds = columns[0]
+    x_min, x_end = (bounds[0], bounds[-1]) if bounds else (0.0, 0.0)
     records: list[dict[str, Any]] = []
 
-    for _bucket, row_words in sorted(grouped.items()):
-        # Check whether this row has a date token in the date column
+    for row_words in _group_by_y(words):
+        # Single pass over the row: find the date token in the date column and
+        # build the column→value map at the same time
         date_token = None
-        for w in row_words:
-            if _RE_DATE_TOKEN.match(w["text"]) and date_range[0] <= w["x0"] <= date_range[1]:
-                date_token = w["text"]
-                break
-        if not date_token:
-            continue
-
-        # Parse DD/MM
-        try:
-            dd, mm = int(date_token[:2]), int(date_token[3:5])
-        except ValueError:
-            continue
-
-        full_date = _reconstruct_date(dd, mm, salary_month)
-
-        # Build column→value map for this row
         col_values: dict[str, Any] = {}
         activity_words: list[tuple[float, str]] = []  # (x0, text)
         for w in row_words:
-            col = _assign_column(w["x0"], config)
+            x0 = w["x0"]
+            text = w["text"]
+            # Cheap x-range test first: most words never reach the token check
+            if (date_token is None and date_lo <= x0 <= date_hi
+                    and _is_date_token(text)):
+                date_token = text
+
+            if x0 < x_min or x0 >= x_end:
+                continue
+            col = _assign_column(x0, columns)
             if col is None:
                 continue
-            text = w["text"]
 
             if col == "standard_hours":
-                std, _ = _parse_standard_hours(text)
-                col_values[col] = std
+                col_values[col] = _parse_standard_hours(text)
             elif col == "shift_marker":
                 col_values["shift_premium"] = (text == "*")
             elif col == "activity":
-                activity_words.append((w["x0"], text))
+                activity_words.append((x0, text))
             else:
                 col_values[col] = text
 
+        if not date_token:
+            continue
+
+        # Parse DD/MM
+        try:
+            dd, mm = int(date_token[:2]), int(date_token[3:5])
+        except ValueError:
+            continue
+
+        full_date = (
+            _reconstruct_date(dd, mm, *salary_year_month)
+            if salary_year_month else None
+        )
+
         # Sort activity words by descending x (rightmost first = correct RTL order)
-        activity_words.sort(key=lambda t: t[0], reverse=True)
+        activity_words.sort(key=itemgetter(0), reverse=True)
         col_values["activity"] = " ".join(text for _, text in activity_words)
 
         activity_raw = col_values.get("activity", "").strip()
         activity_en = ACTIVITY_MAP.get(activity_raw, activity_raw)
 
-        _log(
-            f"Page {page_num} Row {date_token}: "
-            f"{activity_raw} -> {activity_en}"
-        )
+        if verbose or (activity_raw and activity_raw not in ACTIVITY_MAP):
+            _log(
+                f"Page {page_num} Row {date_token}: "
+                f"{activity_raw} -> {activity_en}"
+            )
 
         # Null out time/OT for certain activity types
         null_time = activity_raw in _NULL_ACTIVITIES
@@ -461,9 +568,7 @@ def _parse_data_rows(
         def _t(key: str) -> str | None:
             return None if null_time else col_values.get(key)
 
-        salary_month_display = (
-            salary_month[3:] if salary_month else ""  # 'MM/YYYY'
-        )
+        total_present = _hhmm_to_excel_time(_t("total_present"))
 
         record: dict[str, Any] = {
             "salary_month":          salary_month_display,
@@ -473,7 +578,7 @@ def _parse_data_rows(
             "shift_premium":         col_values.get("shift_premium", False),
             "entry_actual":          _t("entry_actual"),
             "exit_actual":           _t("exit_actual"),
-            "total_present_hours":   _hhmm_to_excel_time(_t("total_present")),
+            "total_present_hours":   total_present,
             "entry_for_pay":         _t("entry_for_pay"),
             "exit_for_pay":          _t("exit_for_pay"),
             "total_for_pay_hours":   _hhmm_to_excel_time(_t("total_for_pay")),
@@ -489,7 +594,7 @@ def _parse_data_rows(
             "night_ot_hours":        _calc_night_ot_hours(
                 _t("entry_actual"),
                 _t("exit_actual"),
-                _hhmm_to_excel_time(_t("total_present")),
+                total_present,
             ),
         }
         records.append(record)
@@ -501,12 +606,89 @@ def _parse_data_rows(
 # Main PDF processing
 # ---------------------------------------------------------------------------
 
-def process_pdf(pdf_path: str) -> list[dict[str, Any]]:
+# Page text/word extraction (pdfminer layout analysis) dominates runtime and is
+# independent per page, so longer PDFs are read in a pool of worker processes.
+# Short ones stay in-process: starting the workers (each re-imports this module
+# and pdfplumber) costs more than it saves on a few pages.
+_PARALLEL_MIN_PAGES = 20
+_MAX_PAGE_WORKERS = 8
+
+
+def _read_page(page) -> tuple[str, list[dict]] | None:
+    """Extract the normalised text and word tokens of a single pdfplumber page.
+
+    Returns None for summary pages (those without the data-page marker). The
+    page's cached layout is released on return.
+    """
+    from pdfplumber.utils.text import WordExtractor
+
+    try:
+        # Group the chars into words once and derive both the page text and the
+        # word list from that map; this is the same grouping that
+        # page.extract_text() and page.extract_words() would each redo.
+        wordmap = WordExtractor(x_tolerance=3, y_tolerance=3).extract_wordmap(
+            page.chars
+        )
+        if not any(_DATA_PAGE_MARKER_RAW in word["text"] for word, _ in wordmap.tuples):
+            return None
+
+        # Same arguments page.extract_text() passes via chars_to_textmap;
+        # presorted keeps the word map's own line grouping and order.
+        raw_text = wordmap.to_textmap(
+            presorted=True,
+            layout_bbox=page.bbox,
+            layout_width=page.width,
+            layout_height=page.height,
+        ).as_string
+        # Normalise each line for header regex matching
+        normalised_text = "\n".join(
+            normalize_line(line) for line in raw_text.splitlines()
+        )
+
+        # Normalise the word tokens
+        words = [word for word, _ in wordmap.tuples]
+        normalize_row_words(words)
+        return normalised_text, words
+    finally:
+        # Drop the page's cached chars/layout so memory stays flat
+        # across long multi-month PDFs.
+        page.close()
+
+
+# The PDF opened by _init_page_worker inside each worker process
+_worker_pdf = None
+
+
+def _init_page_worker(pdf_path: str) -> None:
+    """Worker-process initializer: open *pdf_path* once for all of its page tasks.
+
+    pdfplumber objects cannot cross process boundaries, so each worker holds
+    its own handle instead of reopening the file (and re-parsing its fonts)
+    for every page.
+    """
+    global _worker_pdf
+    import pdfplumber
+
+    _worker_pdf = pdfplumber.open(pdf_path)
+
+
+def _read_worker_page(page_index: int) -> tuple[str, list[dict]] | None:
+    """Worker-process task: read one page of the PDF opened by _init_page_worker."""
+    return _read_page(_worker_pdf.pages[page_index])
+
+
+def process_pdf(pdf_path: str, verbose: bool = False) -> list[dict[str, Any]]:
     """Parse *pdf_path* and return a flat list of daily attendance record dicts.
 
-    Config is reloaded on every call (never cached).
+    Config changes on disk take effect on the next call. With *verbose*, every
+    parsed row is logged as well as the per-page summary.
     """
+    # Imported here rather than at module level: pdfplumber pulls in
+    # pdfminer.six, which would otherwise delay the GUI window at startup.
+    import pdfplumber
+
     config = load_config()
+    columns = _compile_columns(config)
     all_records: list[dict[str, Any]] = []
 
     # Per-employee header fields – carried forward across pages
@@ -518,57 +700,105 @@ def process_pdf(pdf_path: str) -> list[dict[str, Any]]:
     }
 
     with pdfplumber.open(pdf_path) as pdf:
-        for page_num, page in enumerate(pdf.pages, 1):
+        n_pages = len(pdf.pages)
+        workers = min(os.cpu_count() or 1, _MAX_PAGE_WORKERS, n_pages)
+
+        # One zero-argument reader per page, consumed strictly in page order
+        # so header fields carry forward exactly as in a sequential read.
+        in_process = [functools.partial(_read_page, page) for page in pdf.pages]
+        readers = in_process
+        pool: ProcessPoolExecutor | None = None
+        if workers > 1 and n_pages >= _PARALLEL_MIN_PAGES:
             try:
-                raw_text = page.extract_text() or ""
-                # Normalise each line for header regex matching
-                normalised_text = "\n".join(
-                    normalize_line(line) for line in raw_text.splitlines()
-                )
-
-                # Skip summary pages (those without the data-page marker)
-                if not _RE_DATA_PAGE_MARKER.search(normalised_text):
-                    _log(f"Page {page_num}: SUMMARY – skipped")
-                    continue
-
-                # Update employee header fields from this page
-                headers = _extract_headers(normalised_text)
-                if headers.get("employee_id"):
-                    current_employee["employee_id"] = headers["employee_id"]
-                if headers.get("employee_name"):
-                    current_employee["employee_name"] = headers["employee_name"]
-                if headers.get("tag_number"):
-                    current_employee["tag_number"] = headers["tag_number"]
-                if headers.get("salary_month"):
-                    current_employee["salary_month"] = headers["salary_month"]
-
-                # Extract and normalise word tokens
-                words = page.extract_words(x_tolerance=3, y_tolerance=3)
-                normalize_row_words(words)
-
-                page_records = _parse_data_rows(
-                    words,
-                    config,
-                    current_employee["salary_month"],
-                    page_num,
-                )
-
-                # Attach employee header fields to every record
-                for rec in page_records:
-                    rec["employee_id"] = current_employee["employee_id"]
-                    rec["employee_name"] = current_employee["employee_name"]
-                    rec["tag_number"] = current_employee["tag_number"]
-
-                all_records.extend(page_records)
-                _log(
-                    f"Page {page_num}: DATA – "
-                    f"{len(page_records)} rows, "
-                    f"month={current_employee['salary_month']}"
+                # "spawn" everywhere: forking a process that runs Tk plus a
+                # worker thread is unsafe, and it is the only method on Windows.
+                pool = ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_page_worker,
+                    initargs=(pdf_path,),
                 )
+                readers = [
+                    pool.submit(_read_worker_page, i).result
+                    for i in range(n_pages)
+                ]
+                _log(f"Reading {n_pages} pages with {workers} worker processes")
+            except (BrokenExecutor, OSError) as exc:
+                # Child processes could not be started (e.g. blocked by
+                # antivirus in the frozen build): read everything in-process
+                _log(f"Worker processes unavailable ({type(exc).__name__}: {exc}); "
+                     f"reading pages in-process")
+                if pool is not None:
+                    pool.shutdown(cancel_futures=True)
+                    pool = None
+                readers = in_process
 
-            except (OSError, ValueError, AttributeError, KeyError,
-                    TypeError, RuntimeError) as exc:  # noqa: BLE001
-                _log(f"Page {page_num}: ERROR – {type(exc).__name__}: {exc}")
+        try:
+            for page_index in range(n_pages):
+                page_num = page_index + 1
+                try:
+                    # Drop the reader once taken: a pool reader is its future's
+                    # bound result(), which would otherwise keep every page's
+                    # text and words alive until the whole PDF is parsed.
+                    read, readers[page_index] = readers[page_index], None
+                    try:
+                        page_data = read()
+                    except BrokenExecutor as exc:
+                        # A worker died or its initializer failed; every
+                        # pending result is lost, so re-read this page and
+                        # the rest in-process.
+                        _log(f"Worker processes failed ({type(exc).__name__}); "
+                             f"reading pages {page_num}–{n_pages} in-process")
+                        pool.shutdown(cancel_futures=True)
+                        pool = None
+                        readers = in_process
+                        page_data = readers[page_index]()
+
+                    # Skip summary pages (those without the data-page marker)
+                    if page_data is None:
+                        _log(f"Page {page_num}: SUMMARY – skipped")
+                        continue
+                    normalised_text, words = page_data
+
+                    # Update employee header fields from this page
+                    headers = _extract_headers(normalised_text)
+                    if headers.get("employee_id"):
+                        current_employee["employee_id"] = headers["employee_id"]
+                    if headers.get("employee_name"):
+                        current_employee["employee_name"] = headers["employee_name"]
+                    if headers.get("tag_number"):
+                        current_employee["tag_number"] = headers["tag_number"]
+                    if headers.get("salary_month"):
+                        current_employee["salary_month"] = headers["salary_month"]
+
+                    page_records = _parse_data_rows(
+                        words,
+                        config,
+                        columns,
+                        current_employee["salary_month"],
+                        page_num,
+                        verbose,
+                    )
+
+                    # Attach employee header fields to every record
+                    for rec in page_records:
+                        rec["employee_id"] = current_employee["employee_id"]
+                        rec["employee_name"] = current_employee["employee_name"]
+                        rec["tag_number"] = current_employee["tag_number"]
+
+                    all_records.extend(page_records)
+                    _log(
+                        f"Page {page_num}: DATA – "
+                        f"{len(page_records)} rows, "
+                        f"month={current_employee['salary_month']}"
+                    )
+
+                except (OSError, ValueError, AttributeError, KeyError,
+                        TypeError, RuntimeError) as exc:  # noqa: BLE001
+                    _log(f"Page {page_num}: ERROR – {type(exc).__name__}: {exc}")
+        finally:
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
 
     return all_records
 
@@ -605,19 +835,17 @@ _DAILY_COLUMNS: list[tuple[str, str]] = [
     ("Night OT Hours",        "night_ot_hours"),
 ]
 
-# Sheet 2 column positions in Sheet 1 (1-based, for SUMIF formulas)
-# These are the column letters for Sheet 1 columns used in Sheet 2 formulas:
-#   D = salary_month, E = full_date, K = total_present_hours,
-#   N = total_for_pay_hours, P = ot_100, Q = ot_125, R = ot_150, S = ot_200
-# Day type is column G; the day-type-specific counts use SUMIF on G.
-_S1_SALARY_MONTH_COL   = "D"
-_S1_DAY_TYPE_COL       = "G"
-_S1_TOTAL_PRESENT_COL  = "K"
-_S1_TOTAL_FOR_PAY_COL  = "N"
-_S1_OT100_COL          = "P"
-_S1_OT125_COL          = "Q"
-_S1_OT150_COL          = "R"
-_S1_OT200_COL          = "S"
+# Record keys in Sheet 1 column order
+_DAILY_KEYS: tuple[str, ...] = tuple(key for _header, key in _DAILY_COLUMNS)
+
+# Monthly Summary aggregates, in Sheet 2 column order: day counts by day type
+# (columns B–E, then L–O) and hour totals (columns F–K)
+_SUMMARY_LEADING_DAY_TYPES  = ("Work", "Vacation", "Sick", "No Report")
+_SUMMARY_HOUR_KEYS          = (
+    "total_present_hours", "total_for_pay_hours",
+    "ot_100", "ot_125", "ot_150", "ot_200",
+)
+_SUMMARY_TRAILING_DAY_TYPES = ("Military Reserve", "On-Call", "Work Accident", "Recess")
 
 _HEADER_FILL   = PatternFill(start_color="BDD7EE", end_color="BDD7EE", fill_type="solid")
 _HEADER_FONT   = Font(name="Arial", size=10, bold=True)
@@ -629,73 +857,137 @@ _RIGHT_ALIGN   = Alignment(horizontal="right", vertical="center")
 _LEFT_ALIGN    = Alignment(horizontal="left", vertical="center")
 
 # Columns whose data cells should be right-aligned
-_RIGHT_ALIGN_KEYS = {
+_RIGHT_ALIGN_KEYS = frozenset({
     "entry_actual", "exit_actual", "total_present_hours",
     "entry_for_pay", "exit_for_pay", "total_for_pay_hours",
     "standard_hours", "ot_100", "ot_125", "ot_150", "ot_200",
     "shift_bonus_87", "shift_bonus_50", "shift_bonus_20", "deduction",
     "night_ot_hours",
-}
+})
 
 # Columns that hold Excel time fractions and need [h]:mm number format
-_DURATION_KEYS = {
+_DURATION_KEYS = frozenset({
     "total_present_hours", "total_for_pay_hours", "standard_hours",
     "ot_100", "ot_125", "ot_150", "ot_200",
     "shift_bonus_87", "shift_bonus_50", "shift_bonus_20", "deduction",
     "night_ot_hours",
+})
+
+# Named cell styles. Cells refer to them by name: assigning a style by name
+# copies one precomputed style array into the cell instead of interning the
+# font, fill, alignment and number format separately for every cell.
+# The NamedStyle objects themselves are built per workbook by
+# _new_named_styles, because registering one binds it to that workbook.
+_HEADER_STYLE  = "Attendance Header"
+_SUMMARY_STYLE = "Attendance Summary"
+
+# Daily Attendance data-cell styles by cell kind: (label, alignment, number format)
+_DATA_STYLE_KINDS: dict[str, tuple[str, Alignment, str]] = {
+    "date":     ("Date", _RIGHT_ALIGN, "DD/MM/YYYY"),
+    "duration": ("Duration", _RIGHT_ALIGN, "[h]:mm"),
+    "right":    ("Right", _RIGHT_ALIGN, "General"),
+    "left":     ("Left", _LEFT_ALIGN, "General"),
 }
+_ROW_SHADE_FILLS: dict[str, PatternFill] = {"Alt": _ALT_FILL, "White": _WHITE_FILL}
 
 
-def _auto_fit_column(ws, col_idx: int) -> None:
-    """Set column width to max cell content length × 1.2, minimum 10."""
-    max_len = 0
-    col_letter = get_column_letter(col_idx)
-    for cell in ws[col_letter]:
-        try:
-            cell_len = len(str(cell.value)) if cell.value is not None else 0
-            max_len = max(max_len, cell_len)
-        except (AttributeError, TypeError):
-            pass
-    ws.column_dimensions[col_letter].width = max(max_len * 1.2, 10)
+def _data_style_names(shade: str) -> dict[str, str]:
+    """Return the Daily Attendance data-cell style names for one row shade, by cell kind."""
+    return {
+        kind: f"Attendance {label} ({shade})"
+        for kind, (label, _alignment, _number_format) in _DATA_STYLE_KINDS.items()
+    }
+
+
+_ALT_ROW_STYLES   = _data_style_names("Alt")    # even rows
+_WHITE_ROW_STYLES = _data_style_names("White")  # odd rows
+
+
+def _new_named_styles() -> list[NamedStyle]:
+    """Return fresh instances of every named style create_excel registers.
+
+    They are hidden, so they stay out of Excel's Cell Styles gallery.
+    """
+    styles = [
+        NamedStyle(name=_HEADER_STYLE, font=_HEADER_FONT, fill=_HEADER_FILL,
+                   alignment=_HEADER_ALIGN, hidden=True),
+        NamedStyle(name=_SUMMARY_STYLE, font=_DATA_FONT, hidden=True),
+    ]
+    for shade, fill in _ROW_SHADE_FILLS.items():
+        names = _data_style_names(shade)
+        for kind, (_label, alignment, number_format) in _DATA_STYLE_KINDS.items():
+            styles.append(NamedStyle(name=names[kind], font=_DATA_FONT, fill=fill,
+                                     alignment=alignment,
+                                     number_format=number_format, hidden=True))
+    return styles
+
+
+# Style kind of each Sheet 1 column; the Date column switches to "date" per
+# cell, only when the value actually is a date.
+_DAILY_COLUMN_KINDS: list[str] = [
+    "duration" if key in _DURATION_KEYS
+    else "right" if key in _RIGHT_ALIGN_KEYS
+    else "left"
+    for _header, key in _DAILY_COLUMNS
+]
+
+
+def _set_column_widths(ws, rows: list[list[Any]]) -> None:
+    """Set each column width to max cell content length × 1.2, minimum 10.
+
+    *rows* holds the cell values (header row included). Write-only sheets emit
+    column widths ahead of the row data, so this must run before the first append.
+    """
+    for col_idx, column in enumerate(zip(*rows), 1):
+        max_len = max((len(str(v)) for v in column if v is not None), default=0)
+        ws.column_dimensions[get_column_letter(col_idx)].width = max(max_len * 1.2, 10)
+
+
+def _styled_cell(ws, value: Any, style: str) -> WriteOnlyCell:
+    """Return a write-only cell for *ws* holding *value* in the named *style*."""
+    cell = WriteOnlyCell(ws, value=value)
+    cell.style = style
+    return cell
+
+
+def _header_cell(ws, value: str) -> WriteOnlyCell:
+    """Return a write-only header cell for *ws* labelled *value*."""
+    return _styled_cell(ws, value, _HEADER_STYLE)
 
 
 def create_excel(records: list[dict[str, Any]], output_path: str) -> None:
-    """Write *records* to a two-sheet Excel workbook at *output_path*."""
-    wb = openpyxl.Workbook()
+    """Write *records* to a two-sheet Excel workbook at *output_path*.
+
+    Uses a write-only workbook so rows are streamed to disk instead of being
+    held as a full in-memory cell grid.
+    """
+    wb = openpyxl.Workbook(write_only=True)
+    for style in _new_named_styles():
+        wb.add_named_style(style)
 
     # ── Sheet 1: Daily Attendance ─────────────────────────────────────────
-    ws1 = wb.active
-    ws1.title = "Daily Attendance"
+    ws1 = wb.create_sheet(title="Daily Attendance")
 
-    # Write header row
-    for col_idx, (header, _key) in enumerate(_DAILY_COLUMNS, 1):
-        cell = ws1.cell(row=1, column=col_idx, value=header)
-        cell.font = _HEADER_FONT
-        cell.fill = _HEADER_FILL
-        cell.alignment = _HEADER_ALIGN
+    daily_headers = [header for header, _key in _DAILY_COLUMNS]
+    daily_rows = [[record.get(key) for key in _DAILY_KEYS] for record in records]
+
+    # Freeze top row and auto-fit columns (both must precede the first row)
+    ws1.freeze_panes = "A2"
+    _set_column_widths(ws1, [daily_headers] + daily_rows)
+
+    ws1.append([_header_cell(ws1, header) for header in daily_headers])
 
     # Write data rows
-    for row_idx, record in enumerate(records, 2):
-        fill = _ALT_FILL if (row_idx % 2 == 0) else _WHITE_FILL
-        for col_idx, (_header, key) in enumerate(_DAILY_COLUMNS, 1):
-            value = record.get(key)
-            cell = ws1.cell(row=row_idx, column=col_idx, value=value)
-            cell.font = _DATA_FONT
-            cell.fill = fill
+    for row_idx, values in enumerate(daily_rows, 2):
+        styles = _ALT_ROW_STYLES if (row_idx % 2 == 0) else _WHITE_ROW_STYLES
+        row: list[WriteOnlyCell] = []
+        for (_header, key), kind, value in zip(
+            _DAILY_COLUMNS, _DAILY_COLUMN_KINDS, values
+        ):
             if key == "full_date" and isinstance(value, date):
-                cell.number_format = "DD/MM/YYYY"
-                cell.alignment = _RIGHT_ALIGN
-            elif key in _RIGHT_ALIGN_KEYS:
-                if key in _DURATION_KEYS:
-                    cell.number_format = "[h]:mm"
-                cell.alignment = _RIGHT_ALIGN
-            else:
-                cell.alignment = _LEFT_ALIGN
-
-    # Freeze top row and auto-fit columns
-    ws1.freeze_panes = "A2"
-    for col_idx in range(1, len(_DAILY_COLUMNS) + 1):
-        _auto_fit_column(ws1, col_idx)
+                kind = "date"
+            row.append(_styled_cell(ws1, value, styles[kind]))
+        ws1.append(row)
 
     # ── Sheet 2: Monthly Summary ──────────────────────────────────────────
     ws2 = wb.create_sheet(title="Monthly Summary")
@@ -718,74 +1010,39 @@ def create_excel(records: list[dict[str, Any]], output_path: str) -> None:
         "Recess Days",
     ]
 
-    for col_idx, header in enumerate(summary_headers, 1):
-        cell = ws2.cell(row=1, column=col_idx, value=header)
-        cell.font = _HEADER_FONT
-        cell.fill = _HEADER_FILL
-        cell.alignment = _HEADER_ALIGN
-
-    # Collect unique salary months in order of first appearance
-    seen_months: list[str] = []
+    # One pass over the records: per-month day-type counts and hour totals,
+    # with months kept in order of first appearance
+    day_counts: dict[str, Counter[str]] = {}
+    hour_totals: dict[str, list[float]] = {}
     for rec in records:
-        sm = rec.get("salary_month", "")
-        if sm and sm not in seen_months:
-            seen_months.append(sm)
-
-    total_rows = len(records) + 1  # data on Sheet 1 starts at row 2
-
-    for sum_row, month in enumerate(seen_months, 2):
-        # Column A: salary month string
-        ws2.cell(row=sum_row, column=1, value=month).font = _DATA_FONT
-
-        ref_col   = f"'Daily Attendance'!{_S1_SALARY_MONTH_COL}:{_S1_SALARY_MONTH_COL}"
-        type_col  = f"'Daily Attendance'!{_S1_DAY_TYPE_COL}:{_S1_DAY_TYPE_COL}"
-        pres_col  = f"'Daily Attendance'!{_S1_TOTAL_PRESENT_COL}:{_S1_TOTAL_PRESENT_COL}"
-        pay_col   = f"'Daily Attendance'!{_S1_TOTAL_FOR_PAY_COL}:{_S1_TOTAL_FOR_PAY_COL}"
-        ot100_col = f"'Daily Attendance'!{_S1_OT100_COL}:{_S1_OT100_COL}"
-        ot125_col = f"'Daily Attendance'!{_S1_OT125_COL}:{_S1_OT125_COL}"
-        ot150_col = f"'Daily Attendance'!{_S1_OT150_COL}:{_S1_OT150_COL}"
-        ot200_col = f"'Daily Attendance'!{_S1_OT200_COL}:{_S1_OT200_COL}"
-
-        a_ref = f"A{sum_row}"
-
-        def _sumif_type(day_type: str) -> str:
-            return f'=COUNTIFS({ref_col},{a_ref},{type_col},"{day_type}")'
-
-        def _sumif_val(val_col: str) -> str:
-            return f"=SUMIF({ref_col},{a_ref},{val_col})"
-
-        ws2.cell(row=sum_row, column=2,
-                 value=_sumif_type("Work")).font = _DATA_FONT
-        ws2.cell(row=sum_row, column=3,
-                 value=_sumif_type("Vacation")).font = _DATA_FONT
-        ws2.cell(row=sum_row, column=4,
-                 value=_sumif_type("Sick")).font = _DATA_FONT
-        ws2.cell(row=sum_row, column=5,
-                 value=_sumif_type("No Report")).font = _DATA_FONT
-        ws2.cell(row=sum_row, column=6,
-                 value=_sumif_val(pres_col)).font = _DATA_FONT
-        ws2.cell(row=sum_row, column=7,
-                 value=_sumif_val(pay_col)).font = _DATA_FONT
-        ws2.cell(row=sum_row, column=8,
-                 value=_sumif_val(ot100_col)).font = _DATA_FONT
-        ws2.cell(row=sum_row, column=9,
-                 value=_sumif_val(ot125_col)).font = _DATA_FONT
-        ws2.cell(row=sum_row, column=10,
-                 value=_sumif_val(ot150_col)).font = _DATA_FONT
-        ws2.cell(row=sum_row, column=11,
-                 value=_sumif_val(ot200_col)).font = _DATA_FONT
-        ws2.cell(row=sum_row, column=12,
-                 value=_sumif_type("Military Reserve")).font = _DATA_FONT
-        ws2.cell(row=sum_row, column=13,
-                 value=_sumif_type("On-Call")).font = _DATA_FONT
-        ws2.cell(row=sum_row, column=14,
-                 value=_sumif_type("Work Accident")).font = _DATA_FONT
-        ws2.cell(row=sum_row, column=15,
-                 value=_sumif_type("Recess")).font = _DATA_FONT
+        month = rec.get("salary_month", "")
+        if not month:
+            continue
+        if month not in day_counts:
+            day_counts[month] = Counter()
+            hour_totals[month] = [0] * len(_SUMMARY_HOUR_KEYS)
+        day_counts[month][rec.get("day_type")] += 1
+        totals = hour_totals[month]
+        for i, key in enumerate(_SUMMARY_HOUR_KEYS):
+            value = rec.get(key)
+            if value is not None:
+                totals[i] += value
+
+    summary_rows: list[list[Any]] = []
+    for month, counts in day_counts.items():
+        summary_rows.append([
+            month,                                # Column A: salary month string
+            *(counts[day_type] for day_type in _SUMMARY_LEADING_DAY_TYPES),
+            *hour_totals[month],
+            *(counts[day_type] for day_type in _SUMMARY_TRAILING_DAY_TYPES),
+        ])
 
     ws2.freeze_panes = "A2"
-    for col_idx in range(1, len(summary_headers) + 1):
-        _auto_fit_column(ws2, col_idx)
+    _set_column_widths(ws2, [summary_headers] + summary_rows)
+
+    ws2.append([_header_cell(ws2, header) for header in summary_headers])
+    for values in summary_rows:
+        ws2.append([_styled_cell(ws2, value, _SUMMARY_STYLE) for value in values])
 
     wb.save(output_path)
 
@@ -802,6 +1059,7 @@ class AttendanceApp(tk.Tk):
         self.resizable(True, True)
         self._build_ui()
         self.pdf_path: str = ""
+        self._worker: threading.Thread | None = None
 
     def _build_ui(self) -> None:
         pad = {"padx": 8, "pady": 4}
@@ -841,7 +1099,13 @@ class AttendanceApp(tk.Tk):
         log_frame = tk.Frame(self)
         log_frame.pack(fill=tk.BOTH, expand=True, **pad)
 
-        tk.Label(log_frame, text="Log:", anchor="w").pack(fill=tk.X)
+        log_header = tk.Frame(log_frame)
+        log_header.pack(fill=tk.X)
+        tk.Label(log_header, text="Log:", anchor="w").pack(side=tk.LEFT)
+        # Off by default; rows with an unmapped activity are always logged
+        self._verbose_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(log_header, text="Log every row",
+                       variable=self._verbose_var).pack(side=tk.RIGHT)
         self._log_box = scrolledtext.ScrolledText(
             log_frame, height=18, font=("Courier", 9),
             state=tk.DISABLED,
@@ -872,23 +1136,32 @@ class AttendanceApp(tk.Tk):
         self._status_var.set("Processing…")
         _log_messages.clear()
 
-        threading.Thread(
-            target=self._export_worker, daemon=True
-        ).start()
+        self._worker = threading.Thread(
+            target=self._export_worker, args=(self._verbose_var.get(),),
+            daemon=True,
+        )
+        self._worker.start()
         self._poll_logs()
 
     def _poll_logs(self) -> None:
-        """Drain _log_messages into the log box every 100 ms."""
+        """Drain _log_messages into the log box every 100 ms while an export runs."""
+        # Sample liveness before draining so the final messages are never lost
+        running = self._worker is not None and self._worker.is_alive()
+        pending: list[str] = []
         while _log_messages:
-            self._append_log(_log_messages.pop(0))
-        self.after(100, self._poll_logs)
-
-    def _export_worker(self) -> None:
+            pending.append(_log_messages.popleft())
+        if pending:
+            # One widget insert per poll instead of one per message
+            self._append_log("\n".join(pending))
+        if running:
+            self.after(100, self._poll_logs)
+
+    def _export_worker(self, verbose: bool) -> None:
         pdf = self.pdf_path
         base = os.path.splitext(pdf)[0]
         output = base + "_attendance.xlsx"
         try:
-            records = process_pdf(pdf)
+            records = process_pdf(pdf, verbose)
             if not records:
                 self.after(0, self._on_error, "No attendance rows found.")
                 return
@@ -925,6 +1198,8 @@ class AttendanceApp(tk.Tk):
 # ---------------------------------------------------------------------------
 
 if __name__ == "__main__":
+    # Required for the page-reading worker processes in a frozen (PyInstaller) build
+    multiprocessing.freeze_support()
     logging.basicConfig(level=logging.INFO, format="%(message)s")
     app = AttendanceApp()
     app.mainloop()
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# malam_saar_attendance.py is a single top-level script, not an installed package
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
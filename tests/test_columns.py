@@ -0,0 +1,55 @@
+"""Bisect column lookup must agree with a first-match linear scan of the config."""
+
+import math
+import random
+
+import pytest
+
+import malam_saar_attendance as msa
+
+
+def _linear_assign(x0, config):
+    for col, (lo, hi) in config.items():
+        if lo <= x0 <= hi:
+            return col
+    return None
+
+
+def _probe_points(config):
+    """Every range edge, its float neighbours, midpoints, and points off the table."""
+    points = {-1.0, 0.0, 2000.0}
+    for lo, hi in config.values():
+        for b in (lo, hi):
+            points.update((b, math.nextafter(b, -math.inf), math.nextafter(b, math.inf)))
+        points.add((lo + hi) / 2)
+    return sorted(points)
+
+
+@pytest.mark.parametrize("config", [
+    msa.DEFAULT_CONFIG,
+    # Overlapping ranges listed in both orders: the first one in config order wins
+    {"a": [10, 20], "b": [15, 30], "c": [30, 30]},
+    {"b": [15, 30], "a": [10, 20], "c": [30, 30]},
+    {},
+], ids=["default", "overlap", "overlap-reversed", "empty"])
+def test_assign_column_matches_linear_scan(config):
+    columns = msa._compile_columns(config)
+    for x0 in _probe_points(config):
+        assert msa._assign_column(x0, columns) == _linear_assign(x0, config), x0
+
+
+def test_default_config_has_overlapping_ranges():
+    # Guards the test above: the shipped ranges really do overlap
+    # (date/day_of_week and activity/standard_hours), so order matters.
+    cfg = msa.DEFAULT_CONFIG
+    assert cfg["date"][0] <= cfg["day_of_week"][1]
+    assert cfg["standard_hours"][0] <= cfg["activity"][0] <= cfg["standard_hours"][1]
+
+
+def test_assign_column_matches_linear_scan_random():
+    rng = random.Random(0)
+    columns = msa._compile_columns(msa.DEFAULT_CONFIG)
+    for _ in range(20_000):
+        x0 = rng.uniform(0, 900)
+        assert (msa._assign_column(x0, columns)
+                == _linear_assign(x0, msa.DEFAULT_CONFIG)), x0
@@ -0,0 +1,28 @@
+"""Named cell styles: built per workbook, hidden from Excel's Cell Styles gallery."""
+
+import openpyxl
+from openpyxl.styles import NamedStyle
+
+import malam_saar_attendance as msa
+
+_RECORD = {"salary_month": "01/2024", "day_type": "Work", "total_present_hours": 0.5}
+
+
+def test_styles_are_fresh_per_workbook():
+    first, second = msa._new_named_styles(), msa._new_named_styles()
+    assert [s.name for s in first] == [s.name for s in second]
+    assert not any(a is b for a, b in zip(first, second))
+    # Only style names live at module level; no NamedStyle to rebind per export
+    assert not any(isinstance(v, NamedStyle) for v in vars(msa).values())
+
+
+def test_custom_styles_are_hidden(tmp_path):
+    for name in ("a.xlsx", "b.xlsx"):
+        out = tmp_path / name
+        msa.create_excel([_RECORD], str(out))
+        wb = openpyxl.load_workbook(out)
+        custom = [s for s in wb._named_styles if s.name != "Normal"]
+        assert {s.name for s in custom} == {s.name for s in msa._new_named_styles()}
+        assert all(s.hidden for s in custom)
+        cell = wb["Daily Attendance"]["K2"]
+        assert cell.number_format == "[h]:mm" and cell.fill.fgColor.rgb == "00F2F2F2"
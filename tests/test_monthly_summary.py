@@ -0,0 +1,94 @@
+"""Monthly Summary values must equal a per-month recount of the daily records."""
+
+import math
+import random
+
+import openpyxl
+
+import malam_saar_attendance as msa
+
+_DAY_TYPES = [
+    "Work", "Vacation", "Sick", "No Report", "Military Reserve",
+    "On-Call", "Work Accident", "Recess", "Holiday", "לא ממופה",
+]
+_HOUR_KEYS = [
+    "total_present_hours", "total_for_pay_hours",
+    "ot_100", "ot_125", "ot_150", "ot_200",
+]
+
+# Summary header → how to recount it from the records of one month
+_RECOUNT = {
+    "Work Days":             ("count", "Work"),
+    "Vacation Days":         ("count", "Vacation"),
+    "Sick Days":             ("count", "Sick"),
+    "No Report Days":        ("count", "No Report"),
+    "Total Present Hours":   ("sum", "total_present_hours"),
+    "Total For Pay Hours":   ("sum", "total_for_pay_hours"),
+    "Total OT 100%":         ("sum", "ot_100"),
+    "Total OT 125%":         ("sum", "ot_125"),
+    "Total OT 150%":         ("sum", "ot_150"),
+    "Total OT 200%":         ("sum", "ot_200"),
+    "Military Reserve Days": ("count", "Military Reserve"),
+    "On-Call Days":          ("count", "On-Call"),
+    "Work Accident Days":    ("count", "Work Accident"),
+    "Recess Days":           ("count", "Recess"),
+}
+
+
+def _records(n=400, seed=0):
+    rng = random.Random(seed)
+    months = ["03/2024", "01/2024", "02/2024", ""]   # "" = no salary month header
+    records = []
+    for _ in range(n):
+        rec = {key: None for _header, key in msa._DAILY_COLUMNS}
+        rec["salary_month"] = rng.choice(months)
+        rec["day_type"] = rng.choice(_DAY_TYPES)
+        for key in _HOUR_KEYS:
+            if rng.random() < 0.7:
+                rec[key] = rng.randint(0, 12 * 60) / 1440
+        records.append(rec)
+    return records
+
+
+def test_summary_matches_recount(tmp_path):
+    records = _records()
+    out = tmp_path / "summary.xlsx"
+    msa.create_excel(records, str(out))
+
+    ws = openpyxl.load_workbook(out)["Monthly Summary"]
+    rows = list(ws.iter_rows(values_only=True))
+    headers, body = rows[0], rows[1:]
+
+    # One row per non-empty salary month, in order of first appearance
+    expected_months = list(dict.fromkeys(
+        r["salary_month"] for r in records if r["salary_month"]
+    ))
+    assert [row[0] for row in body] == expected_months
+    assert set(headers[1:]) == set(_RECOUNT)
+
+    for row in body:
+        month_records = [r for r in records if r["salary_month"] == row[0]]
+        for header, value in zip(headers[1:], row[1:]):
+            kind, key = _RECOUNT[header]
+            if kind == "count":
+                assert value == sum(r["day_type"] == key for r in month_records), header
+            else:
+                expected = sum(r[key] or 0 for r in month_records)
+                assert math.isclose(value, expected, rel_tol=1e-12), header
+
+
+def test_summary_without_records(tmp_path):
+    out = tmp_path / "empty.xlsx"
+    msa.create_excel([], str(out))
+    ws = openpyxl.load_workbook(out)["Monthly Summary"]
+    assert ws.max_row == 1
+
+
+def test_records_may_omit_columns(tmp_path):
+    # Missing record keys are written as empty cells, not errors
+    out = tmp_path / "partial.xlsx"
+    msa.create_excel([{"salary_month": "01/2024", "day_type": "Work"}], str(out))
+    wb = openpyxl.load_workbook(out)
+    daily = list(wb["Daily Attendance"].iter_rows(min_row=2, values_only=True))
+    assert daily[0][3] == "01/2024" and daily[0][0] is None
+    assert list(wb["Monthly Summary"].iter_rows(min_row=2, values_only=True))[0][:2] == ("01/2024", 1)
@@ -0,0 +1,194 @@
+"""Reading pages in the worker pool must give the same records as reading in-process.
+
+The attendance PDF is generated here: Helvetica with a ToUnicode map that sends
+bytes 0x80-0x9A to the Hebrew letters, so pdfplumber extracts real Hebrew text
+(drawn in visual order, as in the Malam Saar reports) without font files.
+"""
+
+import random
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+import malam_saar_attendance as msa
+
+_HEBREW_FIRST = 0x05D0
+_HEBREW_BYTE = 0x80
+_ACTIVITIES = ["עבודה", "חופשה", "מחלה", "כוננות", "פגרה"]
+
+
+def _visual(line):
+    """Reverse Hebrew tokens, i.e. the order they are drawn in on the page."""
+    return msa.normalize_line(line)
+
+
+def _pdf_string(text):
+    out = []
+    for ch in text:
+        code = ord(ch)
+        if _HEBREW_FIRST <= code <= 0x05EA:
+            code = _HEBREW_BYTE + code - _HEBREW_FIRST
+        if ch in "()\\" or code > 0x7E:
+            out.append(f"\\{code:03o}")
+        else:
+            out.append(ch)
+    return "(" + "".join(out) + ")"
+
+
+def _write_pdf(path, pages):
+    """Write *pages* (lists of (x, y, text)) as a minimal landscape A4 PDF."""
+    objects = []
+
+    def add(body):
+        objects.append(body)
+        return len(objects)
+
+    cmap = (
+        "/CIDInit /ProcSet findresource begin 12 dict begin begincmap\n"
+        "/CMapName /Hebrew def 1 begincodespacerange <00> <FF> endcodespacerange\n"
+        f"1 beginbfrange <{_HEBREW_BYTE:02X}> <{_HEBREW_BYTE + 26:02X}> "
+        f"<{_HEBREW_FIRST:04X}> endbfrange\n"
+        "endcmap CMapName currentdict /CMap defineresource pop end end"
+    ).encode()
+    tounicode = add(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(cmap), cmap))
+    last_char = _HEBREW_BYTE + 26
+    widths = " ".join(["500"] * (last_char - 32 + 1))
+    font = add(
+        f"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /FirstChar 32 "
+        f"/LastChar {last_char} /Widths [{widths}] /ToUnicode {tounicode} 0 R >>"
+        .encode()
+    )
+    pages_id = len(objects) + 1 + 2 * len(pages)
+    page_ids = []
+    for items in pages:
+        content = "\n".join(
+            f"BT /F1 6 Tf {x} {y} Td {_pdf_string(text)} Tj ET" for x, y, text in items
+        ).encode()
+        stream = add(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(content), content))
+        page_ids.append(add(
+            f"<< /Type /Page /Parent {pages_id} 0 R /MediaBox [0 0 842 595] "
+            f"/Resources << /Font << /F1 {font} 0 R >> >> /Contents {stream} 0 R >>"
+            .encode()
+        ))
+    kids = " ".join(f"{i} 0 R" for i in page_ids)
+    assert add(f"<< /Type /Pages /Kids [{kids}] /Count {len(pages)} >>".encode()) == pages_id
+    catalog = add(f"<< /Type /Catalog /Pages {pages_id} 0 R >>".encode())
+
+    data = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for num, body in enumerate(objects, 1):
+        offsets.append(len(data))
+        data += b"%d 0 obj\n%s\nendobj\n" % (num, body)
+    xref = len(data)
+    data += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    data += b"".join(b"%010d 00000 n \n" % off for off in offsets)
+    data += b"trailer\n<< /Size %d /Root %d 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1, catalog, xref)
+    path.write_bytes(bytes(data))
+
+
+def _attendance_page(rng, month, with_header):
+    items = []
+    y = 570
+    if with_header:
+        items.append((600, y, _visual(f"01/{month:02d}/2024 שכר בחודש")))
+        y -= 10
+        items.append((300, y, _visual("בשבוע העבודה ימי ישראל כהן שם 32070758 זהות")))
+        y -= 10
+        items.append((600, y, _visual("1234 תג:")))
+        y -= 10
+    items.append((600, y, _visual("חישוב: רגיל")))
+    y -= 14
+    for day in range(1, 11):
+        entry = rng.randint(6, 12)
+        items += [
+            (800, y, f"{day:02d}/{month:02d}"),
+            (784, y, _visual("אבגדהוש"[day % 7])),
+            (705, y, f"{entry:02d}:{rng.randint(0, 59):02d}"),
+            (678, y, f"{entry + 8:02d}:{rng.randint(0, 59):02d}"),
+            (653, y, f"08:{rng.randint(0, 59):02d}"),
+            (500, y, _visual(rng.choice(_ACTIVITIES))),
+            (436, y, "08:0008:00" if day % 2 else "08:00"),
+        ]
+        y -= 12
+    return items
+
+
+@pytest.fixture
+def attendance_pdf(tmp_path):
+    rng = random.Random(0)
+    pages = [
+        _attendance_page(rng, 1, with_header=True),
+        _attendance_page(rng, 1, with_header=False),   # header carried forward
+        [(600, 570, _visual("סיכום חודשי"))],          # summary page
+        _attendance_page(rng, 2, with_header=True),
+        _attendance_page(rng, 3, with_header=True),
+    ]
+    path = tmp_path / "attendance.pdf"
+    _write_pdf(path, pages)
+    return str(path)
+
+
+def _failing_initializer(pdf_path):
+    raise RuntimeError("worker start blocked")
+
+
+def _read(pdf_path, monkeypatch, parallel):
+    msa._log_messages.clear()
+    monkeypatch.setattr(msa, "_PARALLEL_MIN_PAGES", 2 if parallel else 10**9)
+    monkeypatch.setattr(msa.os, "cpu_count", lambda: 2)
+    return msa.process_pdf(pdf_path), list(msa._log_messages)
+
+
+def test_fixture_is_parsed(attendance_pdf, monkeypatch):
+    records, logs = _read(attendance_pdf, monkeypatch, parallel=False)
+    assert len(records) == 40
+    assert {r["salary_month"] for r in records} == {"01/2024", "02/2024", "03/2024"}
+    assert {r["employee_name"] for r in records} == {"ישראל כהן"}
+    assert "Page 3: SUMMARY – skipped" in logs
+
+
+def test_pool_matches_sequential(attendance_pdf, monkeypatch):
+    sequential, _ = _read(attendance_pdf, monkeypatch, parallel=False)
+    pooled, logs = _read(attendance_pdf, monkeypatch, parallel=True)
+    assert any("worker processes" in line for line in logs)
+    assert pooled == sequential
+
+
+def test_broken_pool_falls_back_to_in_process(attendance_pdf, monkeypatch):
+    sequential, _ = _read(attendance_pdf, monkeypatch, parallel=False)
+    monkeypatch.setattr(msa, "_init_page_worker", _failing_initializer)
+    pooled, logs = _read(attendance_pdf, monkeypatch, parallel=True)
+    assert pooled == sequential
+    assert sum("in-process" in line for line in logs) == 1
+    assert not any("ERROR" in line for line in logs)
+
+
+def test_pool_releases_consumed_pages(attendance_pdf, monkeypatch):
+    futures = []
+
+    class TrackingPool(ProcessPoolExecutor):
+        def submit(self, *args, **kwargs):
+            future = super().submit(*args, **kwargs)
+            futures.append(weakref.ref(future))
+            return future
+
+    # _extract_headers runs right after a data page is read: by then every
+    # earlier page's future (and its text and words) must have been released.
+    first_alive = []
+    extract_headers = msa._extract_headers
+
+    def checking_extract_headers(page_text):
+        alive = [i for i, ref in enumerate(futures) if ref() is not None]
+        assert alive == list(range(alive[0], len(futures)))
+        first_alive.append(alive[0])
+        return extract_headers(page_text)
+
+    monkeypatch.setattr(msa, "ProcessPoolExecutor", TrackingPool)
+    monkeypatch.setattr(msa, "_extract_headers", checking_extract_headers)
+    records, _logs = _read(attendance_pdf, monkeypatch, parallel=True)
+
+    assert len(futures) == 5 and len(records) == 40
+    # Data pages are 0, 1, 3 and 4; page 2 (summary) is released before page 3
+    assert first_alive == [0, 1, 3, 4]
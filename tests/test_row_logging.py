@@ -0,0 +1,34 @@
+"""Per-row log lines: always for unmapped activities, for every row when verbose."""
+
+import malam_saar_attendance as msa
+
+
+def _row(top, date_token, activity):
+    return [
+        {"text": date_token, "x0": 800.0, "top": top},
+        {"text": activity, "x0": 500.0, "top": top},
+    ]
+
+
+def _parse(verbose):
+    msa._log_messages.clear()
+    words = _row(100.0, "01/02", "עבודה") + _row(120.0, "02/02", "פעילות חדשה")
+    columns = msa._compile_columns(msa.DEFAULT_CONFIG)
+    records = msa._parse_data_rows(
+        words, msa.DEFAULT_CONFIG, columns, "01/02/2024", 1, verbose
+    )
+    return records, list(msa._log_messages)
+
+
+def test_unmapped_activity_is_always_logged():
+    records, logs = _parse(verbose=False)
+    assert [r["day_type"] for r in records] == ["Work", "פעילות חדשה"]
+    assert logs == ["Page 1 Row 02/02: פעילות חדשה -> פעילות חדשה"]
+
+
+def test_verbose_logs_every_row():
+    _records, logs = _parse(verbose=True)
+    assert logs == [
+        "Page 1 Row 01/02: עבודה -> Work",
+        "Page 1 Row 02/02: פעילות חדשה -> פעילות חדשה",
+    ]